@@ -0,0 +1,92 @@
+"""
+SSE fanout shared by every stream the SleepSense Data Hub serves.
+
+Published frames go into one ring buffer of the last `backlog` frames;
+each subscriber only keeps the index of the next frame it has to send.
+Publishing is a single slot write no matter how many clients are
+connected, and memory is O(backlog), not O(backlog × clients).  A client
+that falls more than `backlog` frames behind has lost data and is closed.
+
+The subscriber list is an immutable tuple swapped on subscribe /
+unsubscribe, so it can be read (e.g. for a client count) without a lock.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class Client:
+    """One SSE subscriber: its read position in the ring buffer."""
+    next_index: int            # absolute index of the next frame to send
+    closed:     bool = False
+
+
+class Broadcaster:
+    """Pushes pre-encoded SSE frames to every subscribed client."""
+
+    def __init__(self, backlog=200):
+        self.backlog = backlog   # frames a client may lag before it is dropped
+
+        self.clients      = ()                      # swapped, never mutated
+        # threading.Lock *is* _thread.allocate_lock (no Python wrapper), and
+        # the swaps never re-enter, so an RLock variant would only add cost
+        self._swap_lock   = threading.Lock()        # serialises the (rare) swaps only
+        self._frame_ready = threading.Condition()   # notified once per publish()
+
+        self._frames = [None] * backlog
+        self._head   = 0          # absolute index of the next frame to publish
+
+    def subscribe(self):
+        client = Client(next_index=self._head)
+        with self._swap_lock:
+            self.clients = self.clients + (client,)
+        return client
+
+    def unsubscribe(self, client):
+        with self._swap_lock:
+            self.clients = tuple(c for c in self.clients if c is not client)
+
+    def publish(self, msg):
+        """Append `msg` to the ring — O(1) regardless of subscriber count."""
+        # Single publisher (the combiner), so the slot write and head bump
+        # need no lock; readers never look past _head
+        self._frames[self._head % self.backlog] = msg
+        self._head += 1
+
+        # One wakeup for every waiting reader — no per-client polling
+        with self._frame_ready:
+            self._frame_ready.notify_all()
+
+    def next_frame(self, client):
+        """
+        Return the next frame for `client`, or None if it is caught up.
+
+        A client whose next frame has already been overwritten is closed.
+        """
+        i = client.next_index
+        if i >= self._head:
+            return None
+
+        frame = self._frames[i % self.backlog]
+        # Checked after the read: publish() fills slot head % backlog before
+        # bumping _head, so the oldest slot (i == head - backlog) may already
+        # hold the next frame — treat it as gone
+        if self._head - i >= self.backlog:
+            client.closed = True
+            log.warning('[SSE] Dropped client that fell %d frames behind', self._head - i)
+            return None
+
+        client.next_index = i + 1
+        return frame
+
+    def wait(self, client, timeout):
+        """Block until `client` has a frame to send or `timeout` seconds pass."""
+        # Checked under the condition so a frame published between the
+        # check and the wait can't be missed
+        with self._frame_ready:
+            if client.next_index >= self._head:
+                self._frame_ready.wait(timeout)
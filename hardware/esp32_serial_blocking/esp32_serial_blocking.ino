@@ -5,6 +5,7 @@
 
 #include <Arduino.h>
 #include <WiFi.h>
+#include <HTTPClient.h>
 #include <ESP_Google_Sheet_Client.h>
 
 // WiFi credentials
@@ -17,6 +18,10 @@
 const char PRIVATE_KEY[] PROGMEM = "";
 const char spreadsheetId[] = "";
 
+// SleepSense Data Hub push endpoint, e.g. "http://192.168.1.20:5001/emg"
+// Leave empty to rely on the hub polling the sheet instead
+#define DATA_HUB_URL ""
+
 void tokenStatusCallback(TokenInfo info){
     // Silent - no serial output
 }
@@ -108,7 +113,18 @@ void loop() {
     return;
   }
   
-  // Step 2: Send to Google Sheets and WAIT for completion
+  // Step 2a: Push the value straight to the data hub (low latency path)
+  if (WiFi.status() == WL_CONNECTED && strlen(DATA_HUB_URL) > 0) {
+    HTTPClient http;
+    http.setConnectTimeout(500);  // Don't let a down or slow hub delay
+    http.setTimeout(500);         // the sheet write (connect + read)
+    http.begin(DATA_HUB_URL);
+    http.addHeader("Content-Type", "application/json");
+    http.POST("{\"value\":" + String((int)avg) + "}");
+    http.end();
+  }
+
+  // Step 2b: Send to Google Sheets and WAIT for completion
   if (WiFi.status() == WL_CONNECTED && GSheet.ready()) {
     // Get timestamp
     time_t now = time(nullptr);
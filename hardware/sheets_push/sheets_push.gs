@@ -0,0 +1,25 @@
+// Google Apps Script — pushes each new EMG row to the SleepSense Data Hub
+// Paste into Extensions → Apps Script on the EMG sheet, set DATA_HUB_URL,
+// then add an installable "On change" trigger for onSheetChange.
+// Note: triggers do not fire for rows appended through the Sheets API, so
+// this only helps for rows added in the UI or by other non-API writers.
+// The ESP32 sketch appends through the API and POSTs to /emg itself.
+
+const DATA_HUB_URL = 'https://your-host:5001/emg';
+const EMG_COLUMN   = 2;  // Column B
+
+function onSheetChange(e) {
+  const sheet   = SpreadsheetApp.getActiveSpreadsheet().getSheets()[0];
+  const lastRow = sheet.getLastRow();
+  if (lastRow < 2) return;  // header only
+
+  const value = sheet.getRange(lastRow, EMG_COLUMN).getValue();
+  if (value === '' || value === null) return;
+
+  UrlFetchApp.fetch(DATA_HUB_URL, {
+    method: 'post',
+    contentType: 'application/json',
+    payload: JSON.stringify({ value: value }),
+    muteHttpExceptions: true,
+  });
+}
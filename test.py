@@ -2,32 +2,61 @@
 SleepSense Data Hub — Flask server that unifies two real-time sensor streams:
 
   1. Heart Rate: wearable device POSTs to /data (unchanged from before)
-  2. EMG:        ESP32 writes rows to Google Sheets → we poll for new rows
+  2. EMG:        ESP32 writes rows to Google Sheets and POSTs each value to
+                 /emg; we poll the sheet for new rows whenever pushes stop
 
 Both are combined into a 10 Hz SSE stream (GET /stream) consumed by Next.js.
 """
 
 from flask import Flask, request, Response
-import json
+import orjson
 import time
 import threading
-from collections import deque
+import itertools
+import math
+from collections import namedtuple
 import os
+import atexit
+import logging
+import logging.handlers
+import queue
+import sched
+from concurrent.futures import ThreadPoolExecutor
+
+from broadcaster import Broadcaster
 
 app = Flask(__name__)
+log = logging.getLogger('sleepsense')
 
 # ─── Thread-safe shared state ─────────────────────────────────────────────────
 
-latest_hr  = {'bpm': 0.0}
-latest_emg = {'value': 0.0}
-hr_lock    = threading.Lock()
-emg_lock   = threading.Lock()
+# Single-slot lists: storing or loading one float is atomic under the GIL,
+# so readers and writers need no lock.  Revisit for free-threaded builds.
+latest_hr  = [0.0]   # bpm
+latest_emg = [None]  # EmgReading, set below
 
-session_start = time.time()
+# Raw ADC summary of the rows that arrived in one sheet poll (or one push):
+# `value` is the newest reading, min/max/mean/n describe the whole batch and
+# `batch` numbers it, so SSE consumers can tell a new batch from a repeat
+EmgReading     = namedtuple('EmgReading', 'value min max mean n batch')
+_emg_batch_seq = itertools.count(1)
+latest_emg[0]  = EmgReading(0.0, 0.0, 0.0, 0.0, 0, 0)
 
-# SSE clients
-clients      = []
-clients_lock = threading.Lock()
+# Bumped after every sensor write; /latest re-encodes only when it moves
+sensor_version = [0]
+_version_seq   = itertools.count(1)
+latest_cache   = [(0, b'{"bpm":0.0,"emg":0.0}')]   # (version, encoded body)
+
+
+def publish_reading(slot, value):
+    """Store a new sensor value, then bump the version readers cache on."""
+    slot[0] = value
+    sensor_version[0] = next(_version_seq)
+
+
+session_start    = time.time()
+session_start_ns = time.perf_counter_ns()   # clock for SSE 't' offsets
+last_emg_push    = 0.0                      # time.time() of the last POST /emg
 
 # ─── Configuration ─────────────────────────────────────────────────────────────
 
@@ -36,9 +65,20 @@ CREDS_FILE     = os.path.join(os.path.dirname(__file__), 'credentials', 'service
 SCOPES         = ['https://www.googleapis.com/auth/spreadsheets.readonly']
 STREAM_HZ      = 10      # combined stream rate (Hz)
 SHEET_POLL_SEC = 1.0     # how often to poll Google Sheets for new rows
+SHEET_FALLBACK_SEC = 60.0  # poll interval while /emg pushes keep arriving
+
+# ─── SSE Backpressure ─────────────────────────────────────────────────────────
+SSE_BACKLOG      = 200   # frames kept for lagging clients (20 s at 10 Hz)
+SSE_RETRY_MS     = 3000  # browser reconnect delay, sent once per connection
+SSE_KEEPALIVE_SEC = 15.0 # comment frame sent after this long without data
+SSE_MAX_CLIENTS  = 2000  # /stream answers 503 beyond this many subscribers
+
+# SSE clients
+broadcaster = Broadcaster(backlog=SSE_BACKLOG)
 
 # ─── EMG ADC Configuration ────────────────────────────────────────────────────
-EMG_COL        = 1                 # Column B (0-indexed) — where ESP32 writes EMG
+EMG_COL        = 'B'               # Column where ESP32 writes EMG
+EMG_ADC_MAX    = 4095              # 12-bit ADC full scale
 
 
 # ─── CORS ──────────────────────────────────────────────────────────────────────
@@ -62,16 +102,70 @@ def data():
     if request.method == 'OPTIONS':
         return '', 204
 
-    body = request.get_json(force=True)
-    print(f'[HR] Raw payload: {body}')
+    try:
+        body = orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        return 'invalid JSON', 400
+    if not isinstance(body, dict):
+        return 'invalid JSON', 400
+    log.debug('[HR] Raw payload: %s', body)
+
+    payload = body.get('payload') or []
+    if not isinstance(payload, list):
+        return 'invalid payload', 400
+
+    # The wearable almost always sends a single reading — skip the scan
+    if len(payload) == 1:
+        item = payload[0]
+    else:
+        item = next((x for x in payload
+                     if isinstance(x, dict) and x.get('name') == 'heart rate'), None)
+
+    if item is not None and not isinstance(item, dict):
+        return 'invalid payload', 400
+
+    if item and item.get('name') == 'heart rate':
+        values = item.get('values', {})
+        if not isinstance(values, dict):
+            return 'invalid payload', 400
+
+        bpm = values.get('bpm')
+        if bpm is not None:
+            try:
+                bpm = float(bpm)
+            except (TypeError, ValueError):
+                return 'invalid bpm', 400
+            if not math.isfinite(bpm):
+                return 'invalid bpm', 400
+            publish_reading(latest_hr, bpm)
+            log.debug('[HR] %s bpm', bpm)
+
+    return 'ok'
+
+
+# ─── EMG endpoint (ESP32 POSTs here) ──────────────────────────────────────────
 
-    for item in body.get('payload', []):
-        if item.get('name') == 'heart rate':
-            bpm = item.get('values', {}).get('bpm')
-            if bpm is not None:
-                with hr_lock:
-                    latest_hr['bpm'] = float(bpm)
-                print(f'[HR] {bpm} bpm')
+@app.route('/emg', methods=['POST', 'OPTIONS'])
+def emg():
+    if request.method == 'OPTIONS':
+        return '', 204
+
+    global last_emg_push
+    try:
+        body = orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        return 'invalid JSON', 400
+    if not isinstance(body, dict):
+        return 'invalid JSON', 400
+
+    raw_adc = parse_cell_float(body.get('value'))
+    if raw_adc is None or raw_adc > EMG_ADC_MAX:
+        return f'value must be a number in 0–{EMG_ADC_MAX}', 400
+
+    publish_reading(latest_emg, EmgReading(raw_adc, raw_adc, raw_adc, raw_adc, 1,
+                                           next(_emg_batch_seq)))
+    last_emg_push = time.time()
+    log.debug('[EMG] push → ADC=%.0f', raw_adc)
 
     return 'ok'
 
@@ -79,162 +173,291 @@ def data():
 # ─── Google Sheets EMG Polling ─────────────────────────────────────────────────
 
 def init_sheets():
-    """Connect to Google Sheets using service account credentials."""
+    """
+    Connect to Google Sheets using service account credentials.
+
+    The client's session keeps one pooled keep-alive connection to the API
+    (no TLS handshake per poll), asks for gzip, and retries transient 429/5xx
+    responses before the poll loop sees an error.
+    """
     try:
         import gspread
         from google.oauth2.service_account import Credentials
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
 
         creds = Credentials.from_service_account_file(CREDS_FILE, scopes=SCOPES)
         gc = gspread.authorize(creds)
+
+        # gspread >= 6 moved the AuthorizedSession onto gc.http_client
+        session = getattr(gc, 'http_client', gc).session
+        retry   = Retry(total=3, backoff_factor=0.5,
+                        status_forcelist=(429, 500, 502, 503, 504))
+        session.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=2,
+                                              max_retries=retry))
+        session.headers['Accept-Encoding'] = 'gzip'
+        session.headers['User-Agent']      = 'SleepSense-DataHub/1.0'
         spreadsheet = gc.open_by_key(SPREADSHEET_ID)
         return spreadsheet.sheet1
     except Exception as e:
-        print(f'[Sheets] Init failed: {e}')
+        log.error('[Sheets] Init failed: %s', e)
         return None
 
 
 def parse_cell_float(cell):
-    """Safely parse a cell value as a non-negative float."""
-    try:
-        val = float(str(cell).strip())
-        return val if val >= 0 else None
-    except (ValueError, TypeError):
+    """Safely parse a cell value as a finite, non-negative float."""
+    # UNFORMATTED_VALUE reads already hand back numbers — no str round-trip
+    if cell is None or cell == '' or isinstance(cell, bool):
+        return None         # checkbox, empty cell or None
+    if isinstance(cell, (int, float)):
+        val = float(cell)
+    else:
+        try:
+            val = float(cell)   # float() ignores surrounding whitespace itself
+        except (ValueError, TypeError):
+            return None
+    # float() also accepts 'inf', 'nan' and '1e999' — none are readings
+    return val if math.isfinite(val) and val >= 0 else None
+
+
+def summarize_emg(cells):
+    """
+    Fold a batch of EMG cells into one EmgReading in a single pass, so rows
+    written between two polls still show up as min/max/mean instead of
+    being dropped.  Returns None if no cell parses.
+    """
+    n, total = 0, 0.0
+    lo = hi = last = None
+    for cell in cells:
+        val = parse_cell_float(cell)
+        if val is None:
+            continue
+        n     += 1
+        total += val
+        last   = val
+        if lo is None or val < lo:
+            lo = val
+        if hi is None or val > hi:
+            hi = val
+    if not n:
         return None
+    return EmgReading(last, lo, hi, total / n, n, next(_emg_batch_seq))
 
 
-def poll_emg():
+def read_emg_rows(worksheet, row_count):
     """
-    Background thread — polls Google Sheets for new rows written by the ESP32.
+    Return the EMG column cells appended after the first `row_count` rows.
 
-    Uses get_all_values() each cycle (avoids the "exceeds grid limits" error
-    from range reads past the sheet boundary).  For < 10 k rows this is
-    fast enough at 1 req/s and well within Google's 300 reads/min quota.
+    The range starts on the last row we already saw, so it always lies inside
+    the grid (a read starting past the last row fails with "exceeds grid
+    limits"); that overlapping row is dropped before returning.  Payload size
+    tracks the number of new rows, not the size of the sheet.
     """
-    worksheet = init_sheets()
-    if not worksheet:
-        print('[Sheets] ⚠ Could not connect. EMG will remain 0 until Sheets is available.')
-        while not worksheet:
-            time.sleep(10)
-            print('[Sheets] Retrying connection...')
-            worksheet = init_sheets()
+    start = max(row_count, 1)
+    rows  = worksheet.get(f'{EMG_COL}{start}:{EMG_COL}',
+                          value_render_option='UNFORMATTED_VALUE')
+    if row_count:
+        rows = rows[1:]
+    return [row[0] if row else '' for row in rows]
 
-    row_count = 0
 
-    try:
-        all_values = worksheet.get_all_values()
-        row_count  = len(all_values)
-
-        headers = all_values[0] if all_values else []
-        print(f'[Sheets] ✓ Connected — headers: {headers}')
-        print(f'[Sheets]   EMG column: B (index {EMG_COL})')
-        print(f'[Sheets]   Rows in sheet: {row_count}')
-
-        # Seed with the most recent row
-        if row_count > 1:
-            last_row = all_values[-1]
-            if EMG_COL < len(last_row):
-                raw = parse_cell_float(last_row[EMG_COL])
-                if raw is not None:
-                    with emg_lock:
-                        latest_emg['value'] = raw
-                    print(f'[Sheets]   Latest: ADC={raw:.0f}')
+def sheets_rpc(worksheet, row_count):
+    """
+    One blocking round-trip to Google Sheets — runs on the RPC executor.
 
-    except Exception as e:
-        print(f'[Sheets] Initial read error: {e}')
+    Connects first if `worksheet` is None (returning (None, None) when that
+    fails), seeds with the whole EMG column plus headers while `row_count`
+    is None, and otherwise reads just the rows past `row_count`.
+    """
+    if worksheet is None:
+        worksheet = init_sheets()
+        if worksheet is None:
+            return None, None
 
-    # ── Poll loop — grab latest row, convert, stream ──
-    while True:
-        time.sleep(SHEET_POLL_SEC)
-        try:
-            all_values = worksheet.get_all_values()
-            new_count  = len(all_values)
+    if row_count is None:
+        return worksheet, (read_emg_rows(worksheet, 0), worksheet.row_values(1))
+    return worksheet, read_emg_rows(worksheet, row_count)
 
-            if new_count > row_count and new_count > 1:
-                last_row = all_values[-1]
-                if EMG_COL < len(last_row):
-                    raw_adc = parse_cell_float(last_row[EMG_COL])
-                    if raw_adc is not None:
-                        with emg_lock:
-                            latest_emg['value'] = raw_adc
 
-                        added = new_count - row_count
-                        print(f'[Sheets] +{added} rows → ADC={raw_adc:.0f}  (total: {new_count})')
+def poll_emg(scheduler, executor):
+    """
+    Schedules the Google Sheets poller for new rows written by the ESP32.
+
+    Only the tail of column B past the last seen row is fetched each cycle,
+    so a poll costs the same whether the sheet holds 10 or 100 k rows.
 
-                row_count = new_count
+    While the sheet is pushing values to /emg this backs off to one read
+    every SHEET_FALLBACK_SEC, just to keep row_count current in case pushes
+    stop.
 
+    The RPC itself runs on `executor`; the scheduler only submits it and
+    picks up the result on a later tick, so a slow Sheets call never holds
+    up the combiner sharing the scheduler thread.
+    """
+    worksheet = None
+    row_count = None    # None until the sheet has been (re)seeded
+    pending   = None    # Future for the in-flight sheets_rpc()
+
+    def submit():
+        nonlocal pending
+        pending = executor.submit(sheets_rpc, worksheet, row_count)
+        scheduler.enter(1.0 / STREAM_HZ, 0, collect)
+
+    def collect():
+        nonlocal worksheet, row_count
+        if not pending.done():
+            scheduler.enter(1.0 / STREAM_HZ, 0, collect)
+            return
+
+        delay     = SHEET_POLL_SEC
+        connected = True
+        try:
+            worksheet, result = pending.result()
         except Exception as e:
-            print(f'[Sheets] Poll error: {e}')
-            time.sleep(5)
-            worksheet = init_sheets()
-            if worksheet:
-                try:
-                    all_values = worksheet.get_all_values()
-                    row_count  = len(all_values)
-                    print(f'[Sheets] ✓ Reconnected (rows: {row_count})')
-                except Exception:
-                    pass
+            log.error('[Sheets] Poll error: %s', e)
+            worksheet = row_count = None    # reconnect and reseed
+            delay = 5
+        else:
+            if worksheet is None:
+                connected = False
+                delay     = 10
+            elif row_count is None:
+                cells, headers = result
+                row_count = len(cells)
+                log.info('[Sheets] ✓ Connected — headers: %s', headers)
+                log.info('[Sheets]   EMG column: %s', EMG_COL)
+                log.info('[Sheets]   Rows in sheet: %d', row_count)
+
+                # Seed with the most recent row
+                if row_count > 1:
+                    reading = summarize_emg(cells[-1:])
+                    if reading is not None:
+                        publish_reading(latest_emg, reading)
+                        log.info('[Sheets]   Latest: ADC=%.0f', reading.value)
+            elif result:
+                cells   = result
+                # While /emg pushes arrive they carry the live value; this read
+                # only advances row_count — a ~60 s batch summary would clobber
+                # the n=1 push reading with stats unlike the frames around it
+                pushed  = time.time() - last_emg_push < SHEET_FALLBACK_SEC
+                reading = None if pushed else summarize_emg(cells)
+                if reading is not None:
+                    publish_reading(latest_emg, reading)
+
+                    log.debug('[Sheets] +%d rows → ADC=%.0f  [%.0f–%.0f]  (total: %d)',
+                              len(cells), reading.value, reading.min, reading.max,
+                              row_count + len(cells))
+
+                row_count += len(cells)
+
+        # Back off only until the push window closes, so 1 s polling resumes
+        # as soon as pushes have been missing for SHEET_FALLBACK_SEC
+        push_left = last_emg_push + SHEET_FALLBACK_SEC - time.time()
+        if push_left > 0:
+            delay = max(delay, SHEET_POLL_SEC, min(SHEET_FALLBACK_SEC, push_left))
+
+        if not connected:
+            log.warning('[Sheets] ⚠ Could not connect — retrying in %.0fs. EMG keeps its last value.', delay)
+        scheduler.enter(delay, 0, submit)
+
+    scheduler.enter(0, 0, submit)
 
 
 # ─── 10 Hz Combiner / SSE Streamer ────────────────────────────────────────────
 
-def combine_and_stream():
+def combine_and_stream(scheduler):
     """
-    Background thread running at STREAM_HZ.
-    Reads the latest HR + EMG, packages them as a JSON event,
-    and pushes to all connected SSE clients.
+    Schedules the combiner at STREAM_HZ on a fixed monotonic timeline, so
+    time spent broadcasting doesn't drift the cadence.
+    Each tick reads the latest HR + EMG, packages them as a JSON event,
+    and publishes it to all connected SSE clients.
+
+    emg_min/emg_max/emg_mean/emg_n summarise one batch of EMG rows (one
+    sheet poll or one /emg push) and are repeated on every frame until the
+    next batch lands; emg_batch changes exactly when they do, so consumers
+    aggregating over frames should count each emg_batch once.
     """
     interval = 1.0 / STREAM_HZ
 
-    while True:
-        t_ms = int((time.time() - session_start) * 1000)
-
-        with hr_lock:
-            bpm = latest_hr['bpm']
-        with emg_lock:
-            emg = latest_emg['value']
-
-        entry = {
-            'bpm': round(bpm, 1),
-            'emg': round(emg, 1),   # raw ADC value (not volts)
-            't':   t_ms,
-        }
-
-        msg = f"data: {json.dumps(entry)}\n\n"
-
-        with clients_lock:
-            dead = []
-            for q in clients:
-                try:
-                    q.append(msg)
-                except Exception:
-                    dead.append(q)
-            for q in dead:
-                clients.remove(q)
-
-        time.sleep(interval)
+    # Encoded frame body (everything but 't') from the last tick — sensors
+    # update far slower than STREAM_HZ, so most frames only differ in 't'
+    last_key = None
+    prefix   = b''
+
+    next_t = time.monotonic()
+
+    def encode_frame():
+        nonlocal last_key, prefix
+        t_ms = (time.perf_counter_ns() - session_start_ns) // 1_000_000
+
+        bpm = latest_hr[0]
+        emg = latest_emg[0]
+
+        key = (bpm, emg)
+        if key != last_key:
+            entry = {
+                'bpm':       round(bpm, 1),
+                'emg':       round(emg.value, 1),   # raw ADC value (not volts)
+                'emg_min':   round(emg.min, 1),     # over the latest batch of rows
+                'emg_max':   round(emg.max, 1),
+                'emg_mean':  round(emg.mean, 1),
+                'emg_n':     emg.n,
+                'emg_batch': emg.batch,             # changes only with a new batch
+            }
+            prefix   = orjson.dumps(entry)[:-1] + b',"t":'
+            last_key = key
+
+        return b'data: %b%d}\n\n' % (prefix, t_ms)
+
+    def tick():
+        nonlocal next_t
+        # Nobody subscribed (dashboard closed) — keep the cadence, skip the work
+        if broadcaster.clients:
+            broadcaster.publish(encode_frame())
+
+        next_t += interval
+        now = time.monotonic()
+        if now - next_t > 2 * interval:
+            # Fell well behind (e.g. process stalled) — skip the missed ticks
+            # instead of bursting them out back to back
+            missed  = int((now - next_t) // interval)
+            next_t += missed * interval
+            log.warning('[SSE] Combiner fell behind — skipped %d ticks', missed)
+        scheduler.enterabs(next_t, 0, tick)
+
+    scheduler.enterabs(next_t, 0, tick)
 
 
 # ─── SSE Stream Endpoint ──────────────────────────────────────────────────────
 
+# Everything a stream yields is pre-encoded bytes, so Werkzeug writes it as-is
+SSE_RETRY_FRAME     = b'retry: %d\n\n' % SSE_RETRY_MS
+SSE_KEEPALIVE_FRAME = b': keepalive\n\n'
+
 @app.route('/stream')
 def stream():
     """SSE endpoint — Next.js opens this to receive real-time sensor data."""
-    q = deque(maxlen=200)
-    with clients_lock:
-        clients.append(q)
+    # Admission control: shed new streams instead of degrading existing ones
+    if len(broadcaster.clients) >= SSE_MAX_CLIENTS:
+        return Response('overloaded', status=503, headers={
+            'Retry-After': '5',
+            'Connection':  'close',
+        })
+
+    client = broadcaster.subscribe()
 
     def generate():
         try:
-            while True:
-                if q:
-                    yield q.popleft()
-                else:
-                    yield ': keepalive\n\n'
-                    time.sleep(0.2)
-        except GeneratorExit:
-            with clients_lock:
-                if q in clients:
-                    clients.remove(q)
+            yield SSE_RETRY_FRAME
+            while not client.closed:
+                broadcaster.wait(client, SSE_KEEPALIVE_SEC)
+                frame = broadcaster.next_frame(client)
+                if frame is not None:
+                    yield frame
+                elif not client.closed:
+                    yield SSE_KEEPALIVE_FRAME
+        finally:
+            broadcaster.unsubscribe(client)
 
     return Response(
         generate(),
@@ -252,11 +475,16 @@ def stream():
 @app.route('/latest')
 def latest():
     """Returns the most recent HR + EMG readings as JSON."""
-    with hr_lock:
-        bpm = latest_hr['bpm']
-    with emg_lock:
-        emg = latest_emg['value']
-    return json.dumps({'bpm': round(bpm, 1), 'emg': round(emg, 1)})
+    # Version is read before the values: a write racing with this request
+    # can only cause an extra re-encode on the next call, never a stale hit
+    version = sensor_version[0]
+    cached_version, body = latest_cache[0]
+    if cached_version != version:
+        bpm  = latest_hr[0]
+        emg  = latest_emg[0].value
+        body = orjson.dumps({'bpm': round(bpm, 1), 'emg': round(emg, 1)})
+        latest_cache[0] = (version, body)
+    return Response(body, mimetype='application/json')
 
 
 # ─── Session Reset ────────────────────────────────────────────────────────────
@@ -270,33 +498,65 @@ def reset():
     if request.method == 'OPTIONS':
         return '', 204
 
-    global session_start
-    session_start = time.time()
+    global session_start, session_start_ns
+    session_start    = time.time()
+    session_start_ns = time.perf_counter_ns()
 
     # Don't clear sensor values — we want to keep streaming the latest reading
-    print(f'[Flask] Session reset at {session_start}')
-    return json.dumps({'status': 'reset', 'time': session_start})
+    log.info('[Flask] Session reset at %s', session_start)
+    return Response(orjson.dumps({'status': 'reset', 'time': session_start}),
+                    mimetype='application/json')
 
 
 # ─── Startup ──────────────────────────────────────────────────────────────────
 
+def setup_logging():
+    """
+    Route all logging through a queue drained by a background listener, so
+    request handlers and the scheduler never block on stdout.  Per-reading
+    messages are DEBUG; set LOG_LEVEL=DEBUG to see them.
+    """
+    log_queue = queue.Queue(-1)
+    console   = logging.StreamHandler()
+    console.setFormatter(logging.Formatter('%(message)s'))
+
+    listener = logging.handlers.QueueListener(log_queue, console)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+
+
+def start_background_threads():
+    """
+    Start the Sheets poller and the combiner — used by __main__ and wsgi.py.
+
+    Both run as timers on one scheduler thread; only the Sheets RPC gets a
+    worker of its own.
+    """
+    scheduler = sched.scheduler(time.monotonic, time.sleep)
+    rpc_pool  = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sheets-rpc')
+
+    combine_and_stream(scheduler)        # 10 Hz combiner/streamer
+    poll_emg(scheduler, rpc_pool)        # EMG polling (Google Sheets)
+
+    threading.Thread(target=scheduler.run, daemon=True).start()
+
+
 if __name__ == '__main__':
     print('─────────────────────────────────────────')
     print('  SleepSense Data Hub')
     print('─────────────────────────────────────────')
     print(f'  HR input:   POST /data  (from wearable)')
-    print(f'  EMG input:  Google Sheets col B (polled every {SHEET_POLL_SEC}s)')
+    print(f'  EMG input:  POST /emg  (ESP32 push; col {EMG_COL} polled every {SHEET_POLL_SEC}s as fallback)')
     print(f'  EMG ADC:    12-bit raw (0–4095), streamed as-is')
     print(f'  Output:     GET /stream  (SSE @ {STREAM_HZ} Hz)')
     print(f'  Sheet:      {SPREADSHEET_ID}')
     print('─────────────────────────────────────────')
 
-    # Start EMG polling thread (Google Sheets)
-    emg_thread = threading.Thread(target=poll_emg, daemon=True)
-    emg_thread.start()
-
-    # Start 10 Hz combiner/streamer thread
-    combiner_thread = threading.Thread(target=combine_and_stream, daemon=True)
-    combiner_thread.start()
+    setup_logging()
+    start_background_threads()
 
     app.run(host='0.0.0.0', port=5001, threaded=True)
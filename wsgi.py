@@ -0,0 +1,23 @@
+"""
+WSGI entry point for serving the SleepSense Data Hub under gunicorn:
+
+    gunicorn -k gevent -w 1 -b 0.0.0.0:5001 --worker-connections 2000 --keep-alive 75 wsgi:app
+
+Sensor readings and SSE clients live in process memory, so run exactly one
+worker; the gevent worker is what lets that one process hold thousands of
+open streams.  Put an HTTP/2-capable proxy (nginx, Caddy) in front for
+multiplexing and TLS, with proxy buffering off for /stream.
+"""
+
+import os
+import sys
+
+# The hub lives in test.py, which shares its name with the stdlib regression
+# test package — put this directory first so `import test` finds ours even
+# when gunicorn isn't started from the repo root (e.g. --chdir elsewhere)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from test import app, setup_logging, start_background_threads
+
+setup_logging()
+start_background_threads()